@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import asyncio
+import logging
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_db
 from app.api.auth import get_current_user
 from app.models import User, Neologism, LLMResponse, Evaluation
+from app.core.config import settings
 from app.schemas import (
     NeologismCreate, 
+    NeologismBatchCreate, 
     Neologism as NeologismSchema, 
     NeologismList, 
     ConflictResolution
@@ -13,14 +19,137 @@ from app.schemas import (
 from app.services.llm_service import llm_service
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-@router.post("/", response_model=NeologismSchema)
+async def _load_neologism(db: AsyncSession, neologism_id: int):
+    """Fetch a neologism with its relationships eagerly loaded for serialization"""
+    result = await db.execute(
+        select(Neologism)
+        .options(
+            selectinload(Neologism.llm_responses),
+            selectinload(Neologism.evaluations)
+        )
+        .where(Neologism.id == neologism_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def process_neologism(neologism_id: int):
+    """Run the LLM providers and conflict evaluation for a pending neologism"""
+    async with AsyncSessionLocal() as db:
+        db_neologism = await db.get(Neologism, neologism_id)
+        if db_neologism is None:
+            return
+        
+        try:
+            llm_responses = await llm_service.get_definitions(
+                db_neologism.word,
+                db_neologism.user_definition,
+                db_neologism.context
+            )
+            
+            successful_responses = [response for response in llm_responses if response["success"]]
+            
+            # Evaluate conflicts if we have multiple successful responses. An
+            # evaluator failure must not discard the provider answers already paid for
+            evaluation_result = None
+            evaluation_failed = False
+            if len(successful_responses) >= 2:
+                try:
+                    evaluation_result = await llm_service.evaluate_conflicts(
+                        db_neologism.word,
+                        successful_responses
+                    )
+                except Exception:
+                    logger.exception("Error evaluating conflicts for neologism %s", neologism_id)
+                    evaluation_failed = True
+            
+            # Store LLM responses in a single executemany round-trip, together
+            # with the evaluation, once all provider calls have finished
+            if successful_responses:
+                await db.execute(insert(LLMResponse), [
+                    {
+                        "neologism_id": db_neologism.id,
+                        "provider": response["provider"],
+                        "response_data": response["response"].model_dump(mode="json"),
+                        "confidence": int(response["response"].confidence * 100)
+                    }
+                    for response in successful_responses
+                ])
+            
+            if evaluation_result is not None:
+                db_evaluation = Evaluation(
+                    neologism_id=db_neologism.id,
+                    conflicts_detected=evaluation_result.get("conflicts_detected", []),
+                    resolution_required=evaluation_result.get("resolution_required", False),
+                    evaluator_response=evaluation_result
+                )
+                db.add(db_evaluation)
+                
+                # Update neologism status
+                if evaluation_result.get("resolution_required", False):
+                    db_neologism.status = "conflict"
+                else:
+                    db_neologism.status = "evaluated"
+            elif evaluation_failed:
+                db_neologism.status = "llm_error"
+            elif successful_responses:
+                # A single definition has nothing to conflict with
+                db_neologism.status = "evaluated"
+            else:
+                db_neologism.status = "llm_error"
+            
+            # Every completed run leaves a terminal status for pollers
+            await db.commit()
+            
+        except Exception:
+            # If LLM processing fails, keep the neologism but mark as failed
+            logger.exception("Error processing neologism %s with LLM providers", neologism_id)
+            await db.rollback()
+            db_neologism.status = "llm_error"
+            await db.commit()
+
+
+async def process_neologisms(neologism_ids: List[int]):
+    """Process a batch of pending neologisms with bounded concurrency"""
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+    
+    async def process_one(neologism_id: int):
+        async with semaphore:
+            await process_neologism(neologism_id)
+    
+    await asyncio.gather(*(process_one(neologism_id) for neologism_id in neologism_ids))
+
+
+@router.post("/", response_model=NeologismSchema, status_code=status.HTTP_202_ACCEPTED)
 async def create_neologism(
     neologism_data: NeologismCreate,
+    background_tasks: BackgroundTasks,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
+    # Return an already processed identical submission instead of re-querying the providers
+    result = await db.execute(
+        select(Neologism)
+        .options(
+            selectinload(Neologism.llm_responses),
+            selectinload(Neologism.evaluations)
+        )
+        .where(
+            Neologism.user_id == current_user.id,
+            Neologism.word == neologism_data.word,
+            Neologism.user_definition == neologism_data.user_definition,
+            Neologism.status.in_(["evaluated", "resolved"])
+        )
+    )
+    existing = result.scalars().first()
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        return existing
+    
     # Create the neologism record
     db_neologism = Neologism(
         word=neologism_data.word,
@@ -31,85 +160,82 @@ async def create_neologism(
     )
     
     db.add(db_neologism)
-    db.commit()
-    db.refresh(db_neologism)
-    
-    # Get definitions from LLM providers
-    try:
-        llm_responses = await llm_service.get_definitions(
-            neologism_data.word,
-            neologism_data.user_definition,
-            neologism_data.context
-        )
-        
-        # Store LLM responses
-        successful_responses = []
-        for response in llm_responses:
-            if response["success"]:
-                db_response = LLMResponse(
-                    neologism_id=db_neologism.id,
-                    provider=response["provider"],
-                    response_data=response["response"].dict(),
-                    confidence=int(response["response"].confidence * 100)
-                )
-                db.add(db_response)
-                successful_responses.append(response)
-        
-        # Evaluate conflicts if we have multiple successful responses
-        if len(successful_responses) >= 2:
-            evaluation_result = await llm_service.evaluate_conflicts(
-                neologism_data.word,
-                successful_responses
-            )
-            
-            db_evaluation = Evaluation(
-                neologism_id=db_neologism.id,
-                conflicts_detected=evaluation_result.get("conflicts_detected", []),
-                resolution_required=evaluation_result.get("resolution_required", False),
-                evaluator_response=evaluation_result
-            )
-            db.add(db_evaluation)
-            
-            # Update neologism status
-            if evaluation_result.get("resolution_required", False):
-                db_neologism.status = "conflict"
-            else:
-                db_neologism.status = "evaluated"
-        
-        db.commit()
-        db.refresh(db_neologism)
-        
-    except Exception as e:
-        # If LLM processing fails, keep the neologism but mark as failed
-        db_neologism.status = "llm_error"
-        db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing with LLM providers: {str(e)}"
+    await db.commit()
+    
+    # LLM processing runs after the response is sent; clients poll GET /neologisms/{id}
+    background_tasks.add_task(process_neologism, db_neologism.id)
+    
+    return await _load_neologism(db, db_neologism.id)
+
+
+@router.post("/batch", response_model=List[NeologismSchema], status_code=status.HTTP_202_ACCEPTED)
+async def create_neologisms_batch(
+    batch_data: NeologismBatchCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    db_neologisms = [
+        Neologism(
+            word=item.word,
+            user_definition=item.user_definition,
+            context=item.context,
+            user_id=current_user.id,
+            status="pending"
         )
+        for item in batch_data.items
+    ]
     
-    return db_neologism
+    db.add_all(db_neologisms)
+    await db.commit()
+    
+    neologism_ids = [db_neologism.id for db_neologism in db_neologisms]
+    background_tasks.add_task(process_neologisms, neologism_ids)
+    
+    result = await db.execute(
+        select(Neologism)
+        .options(
+            selectinload(Neologism.llm_responses),
+            selectinload(Neologism.evaluations)
+        )
+        .where(Neologism.id.in_(neologism_ids))
+        .order_by(Neologism.id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
 
 
 @router.get("/", response_model=List[NeologismList])
 async def list_neologisms(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    neologisms = db.query(Neologism).filter(Neologism.user_id == current_user.id).all()
-    return neologisms
+    # Plain column rows skip ORM identity-map bookkeeping; NeologismList reads them by attribute
+    result = await db.execute(
+        select(Neologism.id, Neologism.word, Neologism.status, Neologism.created_at)
+        .where(Neologism.user_id == current_user.id)
+    )
+    return result.all()
 
 
 @router.get("/{neologism_id}", response_model=NeologismSchema)
 async def get_neologism(
     neologism_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    neologism = db.query(Neologism).filter(
-        Neologism.id == neologism_id,
-        Neologism.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Neologism)
+        .options(
+            selectinload(Neologism.llm_responses),
+            selectinload(Neologism.evaluations)
+        )
+        .where(
+            Neologism.id == neologism_id,
+            Neologism.user_id == current_user.id
+        )
+    )
+    neologism = result.scalars().first()
     
     if not neologism:
         raise HTTPException(
@@ -125,13 +251,14 @@ async def resolve_conflict(
     neologism_id: int,
     resolution_data: ConflictResolution,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    neologism = db.query(Neologism).filter(
+    result = await db.execute(select(Neologism).where(
         Neologism.id == neologism_id,
         Neologism.user_id == current_user.id,
         Neologism.status == "conflict"
-    ).first()
+    ))
+    neologism = result.scalars().first()
     
     if not neologism:
         raise HTTPException(
@@ -140,9 +267,10 @@ async def resolve_conflict(
         )
     
     # Update the evaluation with user's resolution
-    evaluation = db.query(Evaluation).filter(
+    result = await db.execute(select(Evaluation).where(
         Evaluation.neologism_id == neologism_id
-    ).first()
+    ))
+    evaluation = result.scalars().first()
     
     if evaluation:
         if evaluation.evaluator_response is None:
@@ -157,6 +285,6 @@ async def resolve_conflict(
     # Update neologism status
     neologism.status = "resolved"
     
-    db.commit()
+    await db.commit()
     
     return {"message": "Conflict resolved successfully"}
\ No newline at end of file
@@ -1,17 +1,29 @@
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
 class Settings(BaseSettings):
     secret_key: str = "your-secret-key-here"
     database_url: str = "sqlite:///./neologe.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800
     openai_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
     google_api_key: Optional[str] = None
     access_token_expire_minutes: int = 30
+    cache_backend: str = "memory"  # memory or redis
+    cache_ttl: int = 3600
+    cache_maxsize: int = 10_000
+    redis_url: str = "redis://localhost:6379/0"
+    openai_samples: int = 2  # completions requested per OpenAI call
+    google_candidate_count: int = 1
+    openai_max_concurrency: int = 10
+    anthropic_max_concurrency: int = 10
+    google_max_concurrency: int = 10
+    batch_max_concurrency: int = 5
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 
 settings = Settings()
\ No newline at end of file
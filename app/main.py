@@ -1,16 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api import auth, neologisms
 from app.core.database import engine
 from app.models import Base
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from app.services.llm_cache import llm_cache
+from app.services.llm_service import llm_service
 
 app = FastAPI(
     title="Neologe API",
     description="An API for registering and evaluating neologisms with LLM providers",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -27,6 +28,19 @@ app.include_router(auth.router, prefix="/auth", tags=["authentication"])
 app.include_router(neologisms.router, prefix="/neologisms", tags=["neologisms"])
 
 
+@app.on_event("startup")
+async def startup():
+    # Create database tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await llm_service.aclose()
+    await llm_cache.aclose()
+
+
 @app.get("/")
 async def root():
     return {
@@ -38,4 +52,4 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "llm_cache": llm_cache.stats()}
\ No newline at end of file
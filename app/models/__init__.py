@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -32,13 +32,18 @@ class Neologism(Base):
     user = relationship("User", back_populates="neologisms")
     llm_responses = relationship("LLMResponse", back_populates="neologism")
     evaluations = relationship("Evaluation", back_populates="neologism")
+    
+    __table_args__ = (
+        Index("ix_neologisms_user_word_def", "user_id", "word"),
+        Index("ix_neologisms_user_status", "user_id", "status"),
+    )
 
 
 class LLMResponse(Base):
     __tablename__ = "llm_responses"
     
     id = Column(Integer, primary_key=True, index=True)
-    neologism_id = Column(Integer, ForeignKey("neologisms.id"))
+    neologism_id = Column(Integer, ForeignKey("neologisms.id"), index=True)
     provider = Column(String, nullable=False)  # openai, anthropic, google
     response_data = Column(JSON, nullable=False)
     confidence = Column(Integer)  # 0-100
@@ -51,7 +56,7 @@ class Evaluation(Base):
     __tablename__ = "evaluations"
     
     id = Column(Integer, primary_key=True, index=True)
-    neologism_id = Column(Integer, ForeignKey("neologisms.id"))
+    neologism_id = Column(Integer, ForeignKey("neologisms.id"), index=True)
     conflicts_detected = Column(JSON)  # Array of conflict descriptions
     resolution_required = Column(Boolean, default=False)
     evaluator_response = Column(JSON)
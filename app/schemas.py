@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -22,8 +22,7 @@ class User(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -38,6 +37,10 @@ class NeologismCreate(BaseModel):
     context: Optional[str] = None
 
 
+class NeologismBatchCreate(BaseModel):
+    items: List[NeologismCreate] = Field(..., min_length=1, max_length=100)
+
+
 class LLMResponseData(BaseModel):
     word: str
     definition: str
@@ -55,8 +58,7 @@ class LLMResponse(BaseModel):
     confidence: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Evaluation(BaseModel):
@@ -66,8 +68,7 @@ class Evaluation(BaseModel):
     evaluator_response: Optional[Dict[str, Any]]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Neologism(BaseModel):
@@ -82,8 +83,7 @@ class Neologism(BaseModel):
     llm_responses: List[LLMResponse] = []
     evaluations: List[Evaluation] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NeologismList(BaseModel):
@@ -92,8 +92,7 @@ class NeologismList(BaseModel):
     status: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConflictResolution(BaseModel):
@@ -0,0 +1,80 @@
+import hashlib
+import logging
+import orjson
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """Exact-match cache for LLM responses, backed by memory or Redis"""
+
+    def __init__(self, backend: str = "memory", ttl: int = 3600, maxsize: int = 10_000, redis_url: Optional[str] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        if backend == "redis":
+            import redis.asyncio as redis
+            from redis.exceptions import RedisError
+            self._redis = redis.from_url(redis_url)
+            self._redis_error = RedisError
+        elif backend == "memory":
+            self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        else:
+            raise ValueError(f"Unknown cache backend: {backend}")
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a stable key from everything that determines the LLM output"""
+        return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        if self.backend == "redis":
+            # A cache outage must not fail the LLM call; treat it as a miss
+            try:
+                raw = await self._redis.get(key)
+            except self._redis_error:
+                logger.warning("LLM cache read failed, treating as a miss", exc_info=True)
+                raw = None
+            value = orjson.loads(raw) if raw is not None else None
+        else:
+            value = self._memory.get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a value; per-key ttl is only honoured by the Redis backend"""
+        if self.backend == "redis":
+            try:
+                await self._redis.set(key, orjson.dumps(value), ex=ttl or self.ttl)
+            except self._redis_error:
+                logger.warning("LLM cache write failed, skipping", exc_info=True)
+        else:
+            self._memory[key] = value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    async def aclose(self):
+        if self.backend == "redis":
+            await self._redis.aclose()
+
+
+llm_cache = LLMCache(
+    backend=settings.cache_backend,
+    ttl=settings.cache_ttl,
+    maxsize=settings.cache_maxsize,
+    redis_url=settings.redis_url
+)
\ No newline at end of file
@@ -1,44 +1,41 @@
+import asyncio
 import httpx
-import json
-from typing import List, Dict, Any, Optional
+import orjson
+from tenacity import AsyncRetrying, retry_if_result, stop_after_attempt, wait_exponential_jitter
+from typing import List, Dict, Any, Optional, Tuple
 from app.core.config import settings
 from app.schemas import LLMResponseData
+from app.services.llm_cache import llm_cache
+
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages"
+GOOGLE_GENERATE_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+
+OPENAI_MODEL = "gpt-3.5-turbo"
+ANTHROPIC_MODEL = "claude-3-haiku-20240307"
+GOOGLE_MODEL = "gemini-pro"
+
+# Payloads larger than this are parsed in a worker thread
+LARGE_PAYLOAD_BYTES = 16 * 1024
+
+
+async def _loads(data):
+    """Parse JSON without stalling the event loop on large payloads"""
+    if len(data) > LARGE_PAYLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, data)
+    return orjson.loads(data)
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    """Rate limits and server errors are worth another attempt"""
+    return response.status_code == 429 or response.status_code >= 500
 
 
 class LLMService:
-    def __init__(self):
-        self.providers = {
-            "openai": self._call_openai,
-            "anthropic": self._call_anthropic, 
-            "google": self._call_google
-        }
-    
-    async def get_definitions(self, word: str, user_definition: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get definitions from all three LLM providers"""
-        responses = []
-        
-        for provider_name, provider_func in self.providers.items():
-            try:
-                response = await provider_func(word, user_definition, context)
-                responses.append({
-                    "provider": provider_name,
-                    "response": response,
-                    "success": True
-                })
-            except Exception as e:
-                responses.append({
-                    "provider": provider_name,
-                    "error": str(e),
-                    "success": False
-                })
-        
-        return responses
-    
-    def _create_prompt(self, word: str, user_definition: str, context: Optional[str] = None) -> str:
-        """Create a standardized prompt for all LLM providers"""
-        prompt = f"""Please analyze the neologism "{word}" with the user-provided definition: "{user_definition}"
+    _PROMPT_TEMPLATE = """Please analyze the neologism "{word}" with the user-provided definition: "{user_definition}"
         
-        {"Additional context: " + context if context else ""}
+        {context_block}
         
         Provide a response in the following JSON format:
         {{
@@ -52,197 +49,322 @@ class LLMService:
         }}
         
         Rate your confidence in this analysis on a scale of 0.0 to 1.0."""
-        
-        return prompt
     
-    async def _call_openai(self, word: str, user_definition: str, context: Optional[str] = None) -> LLMResponseData:
-        """Call OpenAI API"""
-        if not settings.openai_api_key:
-            raise ValueError("OpenAI API key not configured")
-        
-        prompt = self._create_prompt(word, user_definition, context)
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-3.5-turbo",
-                    "messages": [
-                        {"role": "system", "content": "You are a linguistic expert analyzing neologisms. Always respond with valid JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3
-                }
+    _EVALUATION_PROMPT_TEMPLATE = """Analyze these LLM responses for the neologism "{word}":
+
+{response_text}
+
+Identify any significant conflicts or disagreements between the definitions, parts of speech, etymologies, or other aspects. 
+
+Respond with JSON in this format:
+{{
+    "conflicts_detected": ["Description of conflict 1", "Description of conflict 2"],
+    "resolution_required": true/false,
+    "overall_confidence": 0.85,
+    "recommended_definition": "Best synthesized definition",
+    "notes": "Additional observations"
+}}
+
+Only flag as requiring resolution if there are major disagreements about meaning or usage."""
+    
+    _DEFINITION_SYSTEM_MESSAGE = {"role": "system", "content": "You are a linguistic expert analyzing neologisms. Always respond with valid JSON."}
+    _EVALUATION_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert linguist evaluating consistency between LLM responses. Always respond with valid JSON."}
+    
+    def __init__(self):
+        self.providers = {
+            "openai": self._call_openai,
+            "anthropic": self._call_anthropic, 
+            "google": self._call_google
+        }
+        self.cache = llm_cache
+        # Bound in-flight calls per provider to stay under each account's rate limits
+        self.semaphores = {
+            "openai": asyncio.Semaphore(settings.openai_max_concurrency),
+            "anthropic": asyncio.Semaphore(settings.anthropic_max_concurrency),
+            "google": asyncio.Semaphore(settings.google_max_concurrency)
+        }
+        # Request headers only depend on configuration, so build them once
+        self._openai_headers = {
+            "Authorization": f"Bearer {settings.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+        self._anthropic_headers = {
+            "x-api-key": settings.anthropic_api_key or "",
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        self._google_headers = {"Content-Type": "application/json"}
+        self._google_url = f"{GOOGLE_GENERATE_URL}?key={settings.google_api_key}"
+        # One long-lived client so provider calls reuse pooled keep-alive connections
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
             )
-            
-            if response.status_code != 200:
-                raise Exception(f"OpenAI API error: {response.status_code} - {response.text}")
-            
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-            
-            # Parse JSON response
+        )
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self.client.aclose()
+    
+    async def get_definitions(self, word: str, user_definition: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get definitions from all three LLM providers concurrently"""
+        tasks = [
+            self._wrap(provider_name, provider_func, word, user_definition, context)
+            for provider_name, provider_func in self.providers.items()
+        ]
+        # Providers may return several samples from one request
+        results = await asyncio.gather(*tasks)
+        return [response for provider_responses in results for response in provider_responses]
+    
+    async def _wrap(self, provider_name: str, provider_func, word: str, user_definition: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Call a single provider, reporting failures instead of raising"""
+        try:
+            samples = await provider_func(word, user_definition, context)
+            return [
+                {
+                    "provider": provider_name,
+                    "response": response,
+                    "raw_json": raw_json,
+                    "success": True
+                }
+                for response, raw_json in samples
+            ]
+        except Exception as e:
+            return [{
+                "provider": provider_name,
+                "error": str(e),
+                "success": False
+            }]
+    
+    async def _post(self, provider: str, url: str, headers: Dict[str, str], body: bytes) -> httpx.Response:
+        """POST to a provider, retrying rate limits and server errors with backoff"""
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential_jitter(initial=1, max=10),
+            retry=retry_if_result(_should_retry),
+            # Hand the last response back so callers report the provider's error
+            retry_error_callback=lambda retry_state: retry_state.outcome.result()
+        )
+        return await retrying(self._send, provider, url, headers, body)
+    
+    async def _send(self, provider: str, url: str, headers: Dict[str, str], body: bytes) -> httpx.Response:
+        # The slot is only held for the request itself, not for backoff sleeps
+        async with self.semaphores[provider]:
+            return await self.client.post(url, headers=headers, content=body)
+    
+    def _create_prompt(self, word: str, user_definition: str, context: Optional[str] = None) -> str:
+        """Create a standardized prompt for all LLM providers"""
+        return self._PROMPT_TEMPLATE.format(
+            word=word,
+            user_definition=user_definition,
+            context_block="Additional context: " + context if context else ""
+        )
+    
+    async def _parse_definitions(self, contents: List[str], cache_key: str, word: str, user_definition: str) -> List[Tuple[LLMResponseData, str]]:
+        """Parse provider answers, keeping their raw JSON for the conflict evaluator"""
+        samples = []
+        parsed_all = True
+        for content in contents:
             try:
-                parsed_response = json.loads(content)
-                return LLMResponseData(**parsed_response)
-            except json.JSONDecodeError:
+                parsed_response = await _loads(content)
+            except orjson.JSONDecodeError:
                 # Fallback if JSON parsing fails
-                return LLMResponseData(
+                fallback = LLMResponseData(
                     word=word,
                     definition=user_definition,
                     part_of_speech="unknown",
                     confidence=0.5
                 )
+                samples.append((fallback, orjson.dumps(fallback.model_dump(mode="json")).decode()))
+                parsed_all = False
+                continue
+            
+            samples.append((LLMResponseData(**parsed_response), content))
+        
+        if parsed_all:
+            await self.cache.set(cache_key, [response.model_dump(mode="json") for response, _ in samples])
+        return samples
+    
+    def _cached_samples(self, cached: List[Dict[str, Any]]) -> List[Tuple[LLMResponseData, str]]:
+        # Cached entries were validated when stored, so skip re-validation
+        return [(LLMResponseData.model_construct(**data), orjson.dumps(data).decode()) for data in cached]
     
-    async def _call_anthropic(self, word: str, user_definition: str, context: Optional[str] = None) -> LLMResponseData:
+    async def _call_openai(self, word: str, user_definition: str, context: Optional[str] = None) -> List[Tuple[LLMResponseData, str]]:
+        """Call OpenAI API"""
+        if not settings.openai_api_key:
+            raise ValueError("OpenAI API key not configured")
+        
+        cache_key = self.cache.make_key(
+            provider="openai", model=OPENAI_MODEL, temperature=0.3, n=settings.openai_samples,
+            word=word, user_definition=user_definition, context=context
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return self._cached_samples(cached)
+        
+        prompt = self._create_prompt(word, user_definition, context)
+        
+        response = await self._post(
+            "openai",
+            OPENAI_CHAT_URL,
+            self._openai_headers,
+            orjson.dumps({
+                "model": OPENAI_MODEL,
+                "messages": [
+                    self._DEFINITION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "n": settings.openai_samples
+            })
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"OpenAI API error: {response.status_code} - {response.text}")
+        
+        result = await _loads(response.content)
+        contents = [choice["message"]["content"] for choice in result["choices"]]
+        
+        return await self._parse_definitions(contents, cache_key, word, user_definition)
+    
+    async def _call_anthropic(self, word: str, user_definition: str, context: Optional[str] = None) -> List[Tuple[LLMResponseData, str]]:
         """Call Anthropic API"""
         if not settings.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
         
+        cache_key = self.cache.make_key(
+            provider="anthropic", model=ANTHROPIC_MODEL, temperature=None, n=1,
+            word=word, user_definition=user_definition, context=context
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return self._cached_samples(cached)
+        
         prompt = self._create_prompt(word, user_definition, context)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": settings.anthropic_api_key,
-                    "Content-Type": "application/json",
-                    "anthropic-version": "2023-06-01"
-                },
-                json={
-                    "model": "claude-3-haiku-20240307",
-                    "max_tokens": 1000,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ]
-                }
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Anthropic API error: {response.status_code} - {response.text}")
-            
-            result = response.json()
-            content = result["content"][0]["text"]
-            
-            # Parse JSON response
-            try:
-                parsed_response = json.loads(content)
-                return LLMResponseData(**parsed_response)
-            except json.JSONDecodeError:
-                return LLMResponseData(
-                    word=word,
-                    definition=user_definition,
-                    part_of_speech="unknown",
-                    confidence=0.5
-                )
+        response = await self._post(
+            "anthropic",
+            ANTHROPIC_MESSAGES_URL,
+            self._anthropic_headers,
+            orjson.dumps({
+                "model": ANTHROPIC_MODEL,
+                "max_tokens": 1000,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ]
+            })
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Anthropic API error: {response.status_code} - {response.text}")
+        
+        result = await _loads(response.content)
+        content = result["content"][0]["text"]
+        
+        return await self._parse_definitions([content], cache_key, word, user_definition)
     
-    async def _call_google(self, word: str, user_definition: str, context: Optional[str] = None) -> LLMResponseData:
+    async def _call_google(self, word: str, user_definition: str, context: Optional[str] = None) -> List[Tuple[LLMResponseData, str]]:
         """Call Google Gemini API"""
         if not settings.google_api_key:
             raise ValueError("Google API key not configured")
         
+        cache_key = self.cache.make_key(
+            provider="google", model=GOOGLE_MODEL, temperature=0.3, n=settings.google_candidate_count,
+            word=word, user_definition=user_definition, context=context
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return self._cached_samples(cached)
+        
         prompt = self._create_prompt(word, user_definition, context)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={settings.google_api_key}",
-                headers={
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "contents": [{
-                        "parts": [{"text": prompt}]
-                    }],
-                    "generationConfig": {
-                        "temperature": 0.3,
-                        "maxOutputTokens": 1000
-                    }
+        response = await self._post(
+            "google",
+            self._google_url,
+            self._google_headers,
+            orjson.dumps({
+                "contents": [{
+                    "parts": [{"text": prompt}]
+                }],
+                "generationConfig": {
+                    "temperature": 0.3,
+                    "maxOutputTokens": 1000,
+                    "candidateCount": settings.google_candidate_count
                 }
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Google API error: {response.status_code} - {response.text}")
-            
-            result = response.json()
-            content = result["candidates"][0]["content"]["parts"][0]["text"]
-            
-            # Parse JSON response
-            try:
-                parsed_response = json.loads(content)
-                return LLMResponseData(**parsed_response)
-            except json.JSONDecodeError:
-                return LLMResponseData(
-                    word=word,
-                    definition=user_definition,
-                    part_of_speech="unknown",
-                    confidence=0.5
-                )
+            })
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Google API error: {response.status_code} - {response.text}")
+        
+        result = await _loads(response.content)
+        contents = [candidate["content"]["parts"][0]["text"] for candidate in result["candidates"]]
+        
+        return await self._parse_definitions(contents, cache_key, word, user_definition)
     
     async def evaluate_conflicts(self, word: str, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Use an LLM to evaluate conflicts between the three responses"""
+        """Use an LLM to evaluate conflicts between the provider responses"""
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key required for conflict evaluation")
         
+        # Key on the normalized samples rather than the prompt text: raw_json is the
+        # provider's original text on a fresh call but a re-dump on a provider cache hit
+        cache_key = self.cache.make_key(
+            provider="openai-evaluator", model=OPENAI_MODEL, temperature=0.1,
+            template=self._EVALUATION_PROMPT_TEMPLATE, word=word,
+            samples=[
+                (resp["provider"], resp["response"].model_dump(mode="json"))
+                for resp in responses if resp["success"]
+            ]
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Format the responses for evaluation
         response_text = ""
         for i, resp in enumerate(responses, 1):
             if resp["success"]:
-                response_text += f"\nProvider {i} ({resp['provider']}):\n{json.dumps(resp['response'].dict(), indent=2)}\n"
+                response_text += f"\nProvider {i} ({resp['provider']}): {resp['raw_json']}\n"
         
-        evaluation_prompt = f"""Analyze these three LLM responses for the neologism "{word}":
-
-{response_text}
-
-Identify any significant conflicts or disagreements between the definitions, parts of speech, etymologies, or other aspects. 
-
-Respond with JSON in this format:
-{{
-    "conflicts_detected": ["Description of conflict 1", "Description of conflict 2"],
-    "resolution_required": true/false,
-    "overall_confidence": 0.85,
-    "recommended_definition": "Best synthesized definition",
-    "notes": "Additional observations"
-}}
-
-Only flag as requiring resolution if there are major disagreements about meaning or usage."""
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-3.5-turbo",
-                    "messages": [
-                        {"role": "system", "content": "You are an expert linguist evaluating consistency between LLM responses. Always respond with valid JSON."},
-                        {"role": "user", "content": evaluation_prompt}
-                    ],
-                    "temperature": 0.1
-                }
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Evaluation API error: {response.status_code} - {response.text}")
-            
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-            
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {
-                    "conflicts_detected": [],
-                    "resolution_required": False,
-                    "overall_confidence": 0.5,
-                    "recommended_definition": "Unable to evaluate",
-                    "notes": "Evaluation parsing failed"
-                }
+        evaluation_prompt = self._EVALUATION_PROMPT_TEMPLATE.format(word=word, response_text=response_text)
+        
+        response = await self._post(
+            "openai",
+            OPENAI_CHAT_URL,
+            self._openai_headers,
+            orjson.dumps({
+                "model": OPENAI_MODEL,
+                "messages": [
+                    self._EVALUATION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": evaluation_prompt}
+                ],
+                "temperature": 0.1
+            })
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Evaluation API error: {response.status_code} - {response.text}")
+        
+        result = await _loads(response.content)
+        content = result["choices"][0]["message"]["content"]
+        
+        try:
+            evaluation = await _loads(content)
+        except orjson.JSONDecodeError:
+            return {
+                "conflicts_detected": [],
+                "resolution_required": False,
+                "overall_confidence": 0.5,
+                "recommended_definition": "Unable to evaluate",
+                "notes": "Evaluation parsing failed"
+            }
+        
+        await self.cache.set(cache_key, evaluation)
+        return evaluation
 
 
 llm_service = LLMService()
\ No newline at end of file
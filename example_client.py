@@ -4,9 +4,8 @@ Example client for the Neologe API
 Demonstrates how to use the neologism registration system
 """
 
-import json
-import urllib.request
-import urllib.parse
+import asyncio
+import httpx
 
 
 class NeologeClient:
@@ -15,24 +14,34 @@ class NeologeClient:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
         self.token = None
+        # One persistent client so requests reuse the same keep-alive connection
+        self._client = httpx.Client(**self._client_options())
+    
+    def _client_options(self):
+        return {
+            'base_url': self.base_url,
+            'timeout': 30,
+            'headers': {'Content-Type': 'application/json'}
+        }
+    
+    def _auth_headers(self):
+        return {'Authorization': f'Bearer {self.token}'} if self.token else None
+    
+    @staticmethod
+    def _parse_response(response):
+        if response.is_error:
+            error_data = response.json()
+            raise Exception(f"API Error {response.status_code}: {error_data.get('error', 'Unknown error')}")
+        return response.json()
     
     def _request(self, method, endpoint, data=None):
         """Make a request to the API"""
-        url = f"{self.base_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
-        
-        req_data = json.dumps(data).encode('utf-8') if data else None
-        req = urllib.request.Request(url, data=req_data, headers=headers, method=method)
-        
-        try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            error_data = json.loads(e.read().decode('utf-8'))
-            raise Exception(f"API Error {e.code}: {error_data.get('error', 'Unknown error')}")
+        response = self._client.request(method, endpoint, json=data, headers=self._auth_headers())
+        return self._parse_response(response)
+    
+    def close(self):
+        """Close the underlying connection pool"""
+        self._client.close()
     
     def register(self, username, email, password):
         """Register a new user"""
@@ -74,6 +83,40 @@ class NeologeClient:
         return self._request('POST', f'/neologisms/{neologism_id}/resolve', data)
 
 
+class AsyncNeologeClient(NeologeClient):
+    """Asyncio variant of NeologeClient; every API method returns an awaitable"""
+    
+    def __init__(self, base_url="http://localhost:8000"):
+        self.base_url = base_url
+        self.token = None
+        self._client = httpx.AsyncClient(**self._client_options())
+    
+    async def _request(self, method, endpoint, data=None):
+        """Make a request to the API"""
+        response = await self._client.request(method, endpoint, json=data, headers=self._auth_headers())
+        return self._parse_response(response)
+    
+    async def login(self, username, password):
+        """Login and store the access token"""
+        result = await self._request('POST', '/auth/login', {
+            'username': username,
+            'password': password
+        })
+        self.token = result['access_token']
+        return result
+    
+    async def submit_neologisms(self, items):
+        """Submit several (word, definition, context) tuples concurrently"""
+        return await asyncio.gather(*(
+            self.submit_neologism(word, definition, context)
+            for word, definition, context in items
+        ))
+    
+    async def close(self):
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+
+
 def main():
     """Example usage of the Neologe API"""
     client = NeologeClient()
@@ -134,6 +177,7 @@ def main():
         print(f"\n6. No conflict to resolve (status: {details['status']})")
     
     print("\n=== Example completed ===")
+    client.close()
 
 
 if __name__ == "__main__":
@@ -5,26 +5,60 @@ A simplified implementation using only Python standard library
 """
 
 import json
+import re
 import sqlite3
 import hashlib
 import secrets
 import hmac
 import time
-from datetime import datetime, timedelta
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
 import threading
+import queue
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JSON helpers: orjson when it is installed, the standard library otherwise.
+# _dumps always returns compact UTF-8 bytes (the same output either way, so
+# stored JSON TEXT stays small); _loads accepts bytes or str.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    _loads = json.loads
 
 
 class Database:
     def __init__(self, db_path="neologe.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._pool = queue.LifoQueue()
+        # username -> user row for authenticated requests, refreshed every minute
+        self.user_cache = TTLCache(maxsize=1024, ttl=60)
         self.init_database()
     
+    def _connect(self):
+        # Pooled connections keep sqlite3's prepared-statement cache warm
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Users table
@@ -79,28 +113,107 @@ class Database:
             )
         ''')
         
+        # Indexes for the per-user listing and per-neologism lookups; id breaks
+        # ties between rows created in the same second without a sort
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_neologisms_user_created ON neologisms (user_id, created_at DESC, id DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_neologism ON llm_responses (neologism_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_evaluations_neologism ON evaluations (neologism_id)")
+        
         conn.commit()
         conn.close()
     
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        """Return the current thread's connection, checking one out of the pool on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            self._local.conn = conn
+        return conn
+    
+    def release_connection(self):
+        """Hand the current thread's connection back to the pool"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            conn.rollback()
+            self._pool.put(conn)
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
 
 
 class AuthService:
     SECRET_KEY = "neologe-secret-key-change-in-production"
+    PBKDF2_ITERATIONS = 100000
+    
+    # HMAC with the ipad/opad key schedule already applied; copied per token
+    _HMAC_TEMPLATE = hmac.new(SECRET_KEY.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    # Passwords that already passed PBKDF2, keyed by the stored salt+hash and
+    # remembered as a peppered SHA-256 so repeat logins skip the slow KDF
+    _PEPPER = secrets.token_bytes(32)
+    _verified_passwords = TTLCache(maxsize=4096, ttl=900)
+    
+    @staticmethod
+    def _pbkdf2(password, salt):
+        # hashlib delegates to OpenSSL's PKCS5_PBKDF2_HMAC, which computes the
+        # HMAC pads once per call and uses the CPU's SHA extensions when present
+        return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), AuthService.PBKDF2_ITERATIONS).hex()
     
     @staticmethod
     def hash_password(password):
         salt = secrets.token_hex(16)
-        pwdhash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
-        return salt + pwdhash.hex()
+        return salt + AuthService._pbkdf2(password, salt)
     
     @staticmethod
     def verify_password(stored_password, provided_password):
+        fast = hashlib.sha256(AuthService._PEPPER + provided_password.encode('utf-8')).digest()
+        cached = AuthService._verified_passwords.get(stored_password)
+        if cached is not None and hmac.compare_digest(cached, fast):
+            return True
+        
         salt = stored_password[:32]
         stored_hash = stored_password[32:]
-        pwdhash = hashlib.pbkdf2_hmac('sha256', provided_password.encode('utf-8'), salt.encode('utf-8'), 100000)
-        return pwdhash.hex() == stored_hash
+        if not hmac.compare_digest(AuthService._pbkdf2(provided_password, salt), stored_hash):
+            return False
+        
+        AuthService._verified_passwords.set(stored_password, fast)
+        return True
+    
+    @staticmethod
+    def _sign(message):
+        mac = AuthService._HMAC_TEMPLATE.copy()
+        mac.update(message.encode('utf-8'))
+        return mac.hexdigest()
     
     @staticmethod
     def create_token(username):
@@ -109,26 +222,18 @@ class AuthService:
             'exp': int(time.time()) + 3600  # 1 hour expiry
         }
         message = json.dumps(payload, sort_keys=True)
-        signature = hmac.new(
-            AuthService.SECRET_KEY.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        signature = AuthService._sign(message)
         return f"{message}.{signature}"
     
     @staticmethod
     def verify_token(token):
         try:
-            parts = token.split('.')
-            if len(parts) != 2:
+            # The hex signature never contains '.', the JSON message may
+            message, sep, signature = token.rpartition('.')
+            if not sep:
                 return None
             
-            message, signature = parts
-            expected_sig = hmac.new(
-                AuthService.SECRET_KEY.encode('utf-8'),
-                message.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
+            expected_sig = AuthService._sign(message)
             
             if not hmac.compare_digest(signature, expected_sig):
                 return None
@@ -145,43 +250,73 @@ class AuthService:
 class LLMService:
     """Mock LLM service - in production this would call real LLM APIs"""
     
+    PROVIDERS = ["openai", "anthropic", "google"]
+    
+    # Constant fields of a mock response; None marks per-call fields, which
+    # are filled in place so the key order of the response is kept
+    _MOCK_TEMPLATE = {
+        "word": None,
+        "definition": None,
+        "part_of_speech": "noun",
+        "etymology": "Possibly derived from existing linguistic patterns",
+        "variations": None,
+        "usage_examples": None,
+        "confidence": 0.8
+    }
+    
+    # Shared across requests so provider calls run side by side without
+    # spawning threads per submission
+    _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+    
+    # Provider results for repeat submissions of the same word and definition
+    _definitions_cache = TTLCache(maxsize=4096, ttl=600)
+    
     @staticmethod
     def get_mock_definition(word, user_definition, provider="mock"):
         """Generate a mock LLM response"""
         return {
+            **LLMService._MOCK_TEMPLATE,
             "word": word,
             "definition": f"A {provider} definition: {user_definition}",
-            "part_of_speech": "noun",
-            "etymology": f"Possibly derived from existing linguistic patterns",
             "variations": {
                 "plural": f"{word}s",
                 "adjective": f"{word}ish"
             },
-            "usage_examples": [f"The {word} was quite remarkable."],
-            "confidence": 0.8
+            "usage_examples": [f"The {word} was quite remarkable."]
         }
     
+    @staticmethod
+    def _call_provider(provider, word, user_definition):
+        try:
+            response_data = LLMService.get_mock_definition(word, user_definition, provider)
+            return {
+                "provider": provider,
+                "response": response_data,
+                "success": True
+            }
+        except Exception as e:
+            return {
+                "provider": provider,
+                "error": str(e),
+                "success": False
+            }
+    
     @staticmethod
     def get_definitions(word, user_definition, context=None):
-        """Get definitions from mock LLM providers"""
-        providers = ["openai", "anthropic", "google"]
-        responses = []
-        
-        for provider in providers:
-            try:
-                response_data = LLMService.get_mock_definition(word, user_definition, provider)
-                responses.append({
-                    "provider": provider,
-                    "response": response_data,
-                    "success": True
-                })
-            except Exception as e:
-                responses.append({
-                    "provider": provider,
-                    "error": str(e),
-                    "success": False
-                })
-        
+        """Get definitions from mock LLM providers concurrently"""
+        key = (word, user_definition, context)
+        responses = LLMService._definitions_cache.get(key)
+        if responses is not None:
+            return responses
+        
+        responses = list(LLMService._executor.map(
+            lambda provider: LLMService._call_provider(provider, word, user_definition),
+            LLMService.PROVIDERS
+        ))
+        
+        # Partial failures are retried on the next submission rather than cached
+        if all(r["success"] for r in responses):
+            LLMService._definitions_cache.set(key, responses)
         return responses
     
     @staticmethod
@@ -203,79 +338,149 @@ class LLMService:
         }
 
 
+# Static responses, serialized once at import time
+_ROOT_BODY = json.dumps({
+    "message": "Welcome to Neologe API",
+    "version": "1.0.0",
+    "endpoints": {
+        "POST /auth/register": "Register a new user",
+        "POST /auth/login": "User login",
+        "POST /neologisms": "Submit a new neologism",
+        "GET /neologisms": "List user's neologisms",
+        "GET /neologisms/{id}": "Get neologism details",
+        "POST /neologisms/{id}/resolve": "Resolve conflicts"
+    }
+}, indent=2).encode('utf-8')
+_HEALTH_BODY = json.dumps({"status": "healthy"}).encode('utf-8')
+_NOT_FOUND_BODY = json.dumps({"error": "Not Found"}).encode('utf-8')
+
+def _iter_json_array(rows, chunk_size=16 * 1024):
+    """Encode rows as a JSON array, yielding it in pieces of roughly chunk_size bytes"""
+    buf = bytearray(b'[')
+    sep = b''
+    for row in rows:
+        buf += sep
+        buf += _dumps(dict(row))
+        sep = b','
+        if len(buf) >= chunk_size:
+            yield bytes(buf)
+            buf.clear()
+    buf += b']'
+    yield bytes(buf)
+
+
+# Largest value sqlite3 can bind as an INTEGER parameter
+_SQLITE_MAX_INT = 2 ** 63 - 1
+
+# /neologisms/{id} and /neologisms/{id}/resolve
+_NEOLOGISM_PATH = re.compile(r'/neologisms/(\d+)(/resolve)?')
+
+# Public neologism fields, in response order
+NEOLOGISM_COLUMNS = "id, word, user_definition, context, status, user_id, created_at, updated_at"
+
+
 class NeologeHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps client connections open between requests
+    protocol_version = "HTTP/1.1"
+    # Buffer wfile so the status line, headers and body leave in one send(),
+    # flushed by handle_one_request (interim 100 Continue is flushed on its
+    # own); TCP_NODELAY pushes it out immediately
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    
     def __init__(self, *args, database=None, **kwargs):
         self.database = database
         super().__init__(*args, **kwargs)
     
-    def _set_headers(self, status=200, content_type="application/json"):
+    def handle_expect_100(self):
+        # The interim 100 Continue must reach the client before it sends the
+        # body, so it cannot wait in the buffer for the final response
+        result = super().handle_expect_100()
+        self.wfile.flush()
+        return result
+    
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        finally:
+            self.database.release_connection()
+    
+    def _set_headers(self, status=200, content_type="application/json", content_length=0):
+        """Send the response headers; content_length=None selects chunked encoding"""
         self.send_response(status)
         self.send_header('Content-type', content_type)
+        if content_length is None:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', str(content_length))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
         self.end_headers()
     
+    def _send_body(self, body, status=200):
+        self._set_headers(status, content_length=len(body))
+        self.wfile.write(body)
+    
+    def _send_json(self, payload, status=200):
+        self._send_body(_dumps(payload), status)
+    
+    def _send_stream(self, chunks, status=200):
+        """Send an iterable of byte strings, chunk-encoded when the client speaks HTTP/1.1"""
+        if self.request_version != 'HTTP/1.1':
+            self._send_body(b''.join(chunks), status)
+            return
+        
+        self._set_headers(status, content_length=None)
+        for chunk in chunks:
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        self.wfile.write(b'0\r\n\r\n')
+    
     def do_OPTIONS(self):
         self._set_headers()
     
     def do_GET(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        if path == '/':
-            self._handle_root()
-        elif path == '/health':
-            self._handle_health()
-        elif path.startswith('/neologisms'):
-            self._handle_get_neologisms(path)
+        path, _, self.query = self.path.partition('?')
+        
+        handler = self._GET_ROUTES.get(path)
+        if handler is not None:
+            handler(self)
+            return
+        
+        match = _NEOLOGISM_PATH.fullmatch(path)
+        if match and not match.group(2):
+            self._handle_get_neologism(match.group(1))
         else:
-            self._send_error(404, "Not Found")
+            self._send_body(_NOT_FOUND_BODY, 404)
     
     def do_POST(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        path = self.path.partition('?')[0]
         
         content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8')
+        post_data = self.rfile.read(content_length)
         
         try:
-            data = json.loads(post_data) if post_data else {}
-        except json.JSONDecodeError:
+            data = _loads(post_data) if post_data else {}
+        except ValueError:
             self._send_error(400, "Invalid JSON")
             return
         
-        if path == '/auth/register':
-            self._handle_register(data)
-        elif path == '/auth/login':
-            self._handle_login(data)
-        elif path == '/neologisms':
-            self._handle_create_neologism(data)
-        elif path.startswith('/neologisms/') and path.endswith('/resolve'):
-            neologism_id = path.split('/')[-2]
-            self._handle_resolve_conflict(neologism_id, data)
+        handler = self._POST_ROUTES.get(path)
+        if handler is not None:
+            handler(self, data)
+            return
+        
+        match = _NEOLOGISM_PATH.fullmatch(path)
+        if match and match.group(2):
+            self._handle_resolve_conflict(match.group(1), data)
         else:
-            self._send_error(404, "Not Found")
+            self._send_body(_NOT_FOUND_BODY, 404)
     
     def _handle_root(self):
-        self._set_headers()
-        response = {
-            "message": "Welcome to Neologe API",
-            "version": "1.0.0",
-            "endpoints": {
-                "POST /auth/register": "Register a new user",
-                "POST /auth/login": "User login",
-                "POST /neologisms": "Submit a new neologism",
-                "GET /neologisms": "List user's neologisms",
-                "GET /neologisms/{id}": "Get neologism details",
-                "POST /neologisms/{id}/resolve": "Resolve conflicts"
-            }
-        }
-        self.wfile.write(json.dumps(response, indent=2).encode('utf-8'))
+        self._send_body(_ROOT_BODY)
     
     def _handle_health(self):
-        self._set_headers()
-        self.wfile.write(json.dumps({"status": "healthy"}).encode('utf-8'))
+        self._send_body(_HEALTH_BODY)
     
     def _handle_register(self, data):
         if not all(key in data for key in ['username', 'email', 'password']):
@@ -286,11 +491,13 @@ class NeologeHandler(BaseHTTPRequestHandler):
         cursor = conn.cursor()
         
         # Check if user exists
-        cursor.execute("SELECT id FROM users WHERE username = ? OR email = ?", 
-                      (data['username'], data['email']))
+        # Two probes so each UNIQUE index is used on its own
+        cursor.execute(
+            "SELECT id FROM users WHERE username = ? UNION ALL SELECT id FROM users WHERE email = ? LIMIT 1",
+            (data['username'], data['email'])
+        )
         if cursor.fetchone():
             self._send_error(400, "Username or email already exists")
-            conn.close()
             return
         
         # Create user
@@ -301,15 +508,13 @@ class NeologeHandler(BaseHTTPRequestHandler):
         )
         user_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
-        self._set_headers(201)
         response = {
             "id": user_id,
             "username": data['username'],
             "email": data['email']
         }
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self._send_json(response, 201)
     
     def _handle_login(self, data):
         if not all(key in data for key in ['username', 'password']):
@@ -321,19 +526,17 @@ class NeologeHandler(BaseHTTPRequestHandler):
         
         cursor.execute("SELECT password_hash FROM users WHERE username = ?", (data['username'],))
         result = cursor.fetchone()
-        conn.close()
         
-        if not result or not AuthService.verify_password(result[0], data['password']):
+        if not result or not AuthService.verify_password(result['password_hash'], data['password']):
             self._send_error(401, "Invalid credentials")
             return
         
         token = AuthService.create_token(data['username'])
-        self._set_headers()
         response = {
             "access_token": token,
             "token_type": "bearer"
         }
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self._send_json(response)
     
     def _get_current_user(self):
         auth_header = self.headers.get('Authorization')
@@ -341,18 +544,24 @@ class NeologeHandler(BaseHTTPRequestHandler):
             return None
         
         token = auth_header[7:]  # Remove 'Bearer ' prefix
+        # The signature and expiry are checked on every request; only the user row is cached
         username = AuthService.verify_token(token)
         if not username:
             return None
         
+        user = self.database.user_cache.get(username)
+        if user is not None:
+            return user
+        
         conn = self.database.get_connection()
         cursor = conn.cursor()
         cursor.execute("SELECT id, username, email FROM users WHERE username = ?", (username,))
         result = cursor.fetchone()
-        conn.close()
         
         if result:
-            return {"id": result[0], "username": result[1], "email": result[2]}
+            user = dict(result)
+            self.database.user_cache.set(username, user)
+            return user
         return None
     
     def _handle_create_neologism(self, data):
@@ -365,116 +574,111 @@ class NeologeHandler(BaseHTTPRequestHandler):
             self._send_error(400, "Missing word or definition")
             return
         
-        conn = self.database.get_connection()
-        cursor = conn.cursor()
-        
-        # Create neologism
-        cursor.execute(
-            "INSERT INTO neologisms (word, user_definition, context, user_id, status) VALUES (?, ?, ?, ?, 'pending')",
-            (data['word'], data['user_definition'], data.get('context'), user['id'])
-        )
-        neologism_id = cursor.lastrowid
+        status = 'pending'
+        llm_rows = []
+        evaluation_row = None
         
+        # Provider calls and evaluation run before any write, so the
+        # SQLite write lock is only held for the inserts below
         try:
             # Get LLM responses
             llm_responses = LLMService.get_definitions(
                 data['word'], data['user_definition'], data.get('context')
             )
             
-            successful_responses = []
-            for response in llm_responses:
-                if response["success"]:
-                    cursor.execute(
-                        "INSERT INTO llm_responses (neologism_id, provider, response_data, confidence) VALUES (?, ?, ?, ?)",
-                        (neologism_id, response["provider"], json.dumps(response["response"]), 
-                         int(response["response"]["confidence"] * 100))
-                    )
-                    successful_responses.append(response)
+            successful_responses = [r for r in llm_responses if r["success"]]
+            llm_rows = [
+                (r["provider"], _dumps(r["response"]).decode('utf-8'), int(r["response"]["confidence"] * 100))
+                for r in successful_responses
+            ]
             
             # Evaluate conflicts
             if len(successful_responses) >= 2:
                 evaluation = LLMService.evaluate_conflicts(data['word'], successful_responses)
-                cursor.execute(
-                    "INSERT INTO evaluations (neologism_id, conflicts_detected, resolution_required, evaluator_response) VALUES (?, ?, ?, ?)",
-                    (neologism_id, json.dumps(evaluation.get("conflicts_detected", [])), 
-                     1 if evaluation.get("resolution_required", False) else 0,
-                     json.dumps(evaluation))
+                evaluation_row = (
+                    _dumps(evaluation.get("conflicts_detected", [])).decode('utf-8'),
+                    1 if evaluation.get("resolution_required", False) else 0,
+                    _dumps(evaluation).decode('utf-8')
                 )
-                
                 status = "conflict" if evaluation.get("resolution_required", False) else "evaluated"
-                cursor.execute("UPDATE neologisms SET status = ? WHERE id = ?", (status, neologism_id))
-            
-            conn.commit()
             
         except Exception as e:
-            cursor.execute("UPDATE neologisms SET status = 'llm_error' WHERE id = ?", (neologism_id,))
-            conn.commit()
+            status = 'llm_error'
+            llm_rows = []
+            evaluation_row = None
         
-        # Get the created neologism
-        cursor.execute("SELECT * FROM neologisms WHERE id = ?", (neologism_id,))
-        result = cursor.fetchone()
-        conn.close()
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
         
-        self._set_headers(201)
-        response = {
-            "id": result[0],
-            "word": result[1],
-            "user_definition": result[2],
-            "context": result[3],
-            "status": result[4],
-            "user_id": result[5],
-            "created_at": result[6],
-            "updated_at": result[7]
-        }
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        # One short transaction for the neologism, its LLM responses and evaluation
+        with conn:
+            cursor.execute(
+                "INSERT INTO neologisms (word, user_definition, context, user_id, status) VALUES (?, ?, ?, ?, ?) "
+                f"RETURNING {NEOLOGISM_COLUMNS}",
+                (data['word'], data['user_definition'], data.get('context'), user['id'], status)
+            )
+            created = cursor.fetchone()
+            neologism_id = created['id']
+            
+            cursor.executemany(
+                "INSERT INTO llm_responses (neologism_id, provider, response_data, confidence) VALUES (?, ?, ?, ?)",
+                [(neologism_id,) + row for row in llm_rows]
+            )
+            if evaluation_row is not None:
+                cursor.execute(
+                    "INSERT INTO evaluations (neologism_id, conflicts_detected, resolution_required, evaluator_response) VALUES (?, ?, ?, ?)",
+                    (neologism_id,) + evaluation_row
+                )
+        
+        self._send_json(dict(created), 201)
     
-    def _handle_get_neologisms(self, path):
+    def _handle_list_neologisms(self):
         user = self._get_current_user()
         if not user:
             self._send_error(401, "Authentication required")
             return
         
+        # Optional ?limit=&offset= pagination; no limit by default
+        params = parse_qs(self.query)
+        try:
+            limit = int(params.get('limit', ['-1'])[0])
+            offset = int(params.get('offset', ['0'])[0])
+        except ValueError:
+            self._send_error(400, "limit and offset must be integers")
+            return
+        if limit < -1 or offset < 0:
+            self._send_error(400, "limit and offset must not be negative")
+            return
+        if limit > _SQLITE_MAX_INT or offset > _SQLITE_MAX_INT:
+            self._send_error(400, "limit and offset must fit in a 64-bit integer")
+            return
+        
         conn = self.database.get_connection()
         cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, word, status, created_at FROM neologisms WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (user['id'], limit, offset)
+        )
+        self._send_stream(_iter_json_array(cursor))
+    
+    def _handle_get_neologism(self, neologism_id):
+        user = self._get_current_user()
+        if not user:
+            self._send_error(401, "Authentication required")
+            return
         
-        if path == '/neologisms':
-            # List all neologisms for user
-            cursor.execute(
-                "SELECT id, word, status, created_at FROM neologisms WHERE user_id = ? ORDER BY created_at DESC",
-                (user['id'],)
-            )
-            results = cursor.fetchall()
-            neologisms = [
-                {"id": r[0], "word": r[1], "status": r[2], "created_at": r[3]}
-                for r in results
-            ]
-        else:
-            # Get specific neologism
-            neologism_id = path.split('/')[-1]
-            cursor.execute(
-                "SELECT * FROM neologisms WHERE id = ? AND user_id = ?",
-                (neologism_id, user['id'])
-            )
-            result = cursor.fetchone()
-            if not result:
-                conn.close()
-                self._send_error(404, "Neologism not found")
-                return
-            
-            neologisms = {
-                "id": result[0],
-                "word": result[1],
-                "user_definition": result[2],
-                "context": result[3],
-                "status": result[4],
-                "user_id": result[5],
-                "created_at": result[6],
-                "updated_at": result[7]
-            }
+        conn = self.database.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT {NEOLOGISM_COLUMNS} FROM neologisms WHERE id = ? AND user_id = ?",
+            (neologism_id, user['id'])
+        )
+        result = cursor.fetchone()
+        if not result:
+            self._send_error(404, "Neologism not found")
+            return
         
-        conn.close()
-        self._set_headers()
-        self.wfile.write(json.dumps(neologisms).encode('utf-8'))
+        self._send_json(dict(result))
     
     def _handle_resolve_conflict(self, neologism_id, data):
         user = self._get_current_user()
@@ -492,34 +696,41 @@ class NeologeHandler(BaseHTTPRequestHandler):
         )
         result = cursor.fetchone()
         if not result:
-            conn.close()
             self._send_error(404, "Neologism not found")
             return
         
-        if result[0] != 'conflict':
-            conn.close()
+        if result['status'] != 'conflict':
             self._send_error(400, "Neologism is not in conflict status")
             return
         
-        # Update evaluation with resolution
+        # Update evaluation with resolution; json() makes SQLite embed it as an object, not a string
         cursor.execute(
-            "UPDATE evaluations SET evaluator_response = json_set(evaluator_response, '$.user_resolution', ?) WHERE neologism_id = ?",
-            (json.dumps(data), neologism_id)
+            "UPDATE evaluations SET evaluator_response = json_set(evaluator_response, '$.user_resolution', json(?)) WHERE neologism_id = ?",
+            (_dumps(data).decode('utf-8'), neologism_id)
         )
         
         # Update neologism status
         cursor.execute("UPDATE neologisms SET status = 'resolved' WHERE id = ?", (neologism_id,))
         
         conn.commit()
-        conn.close()
         
-        self._set_headers()
-        self.wfile.write(json.dumps({"message": "Conflict resolved successfully"}).encode('utf-8'))
+        self._send_json({"message": "Conflict resolved successfully"})
     
     def _send_error(self, status, message):
-        self._set_headers(status)
         response = {"error": message}
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self._send_json(response, status)
+    
+    # Exact-path dispatch; /neologisms/{id} routes go through _NEOLOGISM_PATH
+    _GET_ROUTES = {
+        '/': _handle_root,
+        '/health': _handle_health,
+        '/neologisms': _handle_list_neologisms,
+    }
+    _POST_ROUTES = {
+        '/auth/register': _handle_register,
+        '/auth/login': _handle_login,
+        '/neologisms': _handle_create_neologism,
+    }
 
 
 def create_handler_class(database):
@@ -535,7 +746,7 @@ def main():
     
     # Create server
     handler_class = create_handler_class(database)
-    server = HTTPServer(('localhost', 8000), handler_class)
+    server = ThreadingHTTPServer(('localhost', 8000), handler_class)
     
     print("Starting Neologe API server on http://localhost:8000")
     print("API Documentation available at /")
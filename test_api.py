@@ -4,7 +4,7 @@ Test script for Neologe API
 """
 
 import json
-import urllib.request
+import http.client
 import urllib.parse
 import time
 
@@ -13,10 +13,13 @@ class NeologeAPIClient:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
         self.token = None
+        
+        # One persistent connection, reused across requests (HTTP/1.1 keep-alive)
+        parts = urllib.parse.urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.netloc, timeout=30)
     
     def _make_request(self, method, endpoint, data=None, headers=None):
-        url = f"{self.base_url}{endpoint}"
-        
         if headers is None:
             headers = {'Content-Type': 'application/json'}
         
@@ -27,19 +30,22 @@ class NeologeAPIClient:
         if data:
             req_data = json.dumps(data).encode('utf-8')
         
-        req = urllib.request.Request(url, data=req_data, headers=headers, method=method)
+        self.connection.request(method, endpoint, body=req_data, headers=headers)
+        response = self.connection.getresponse()
+        body = response.read().decode('utf-8')
         
-        try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
+        if response.status >= 400:
             try:
-                error_data = json.loads(error_body)
-                print(f"HTTP {e.code} Error: {error_data}")
+                error_data = json.loads(body)
+                print(f"HTTP {response.status} Error: {error_data}")
             except:
-                print(f"HTTP {e.code} Error: {error_body}")
+                print(f"HTTP {response.status} Error: {body}")
             return None
+        
+        return json.loads(body)
+    
+    def close(self):
+        self.connection.close()
     
     def register(self, username, email, password):
         return self._make_request('POST', '/auth/register', {
@@ -66,8 +72,16 @@ class NeologeAPIClient:
             data['context'] = context
         return self._make_request('POST', '/neologisms', data)
     
-    def list_neologisms(self):
-        return self._make_request('GET', '/neologisms')
+    def list_neologisms(self, limit=None, offset=None):
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        endpoint = '/neologisms'
+        if params:
+            endpoint += '?' + urllib.parse.urlencode(params)
+        return self._make_request('GET', endpoint)
     
     def get_neologism(self, neologism_id):
         return self._make_request('GET', f'/neologisms/{neologism_id}')
@@ -129,6 +143,15 @@ def test_api():
         list_result = client.list_neologisms()
         print(f"Neologisms list: {list_result}")
         
+        # Test pagination
+        print("\n5b. Testing neologism listing with limit/offset...")
+        first_page = client.list_neologisms(limit=1)
+        second_page = client.list_neologisms(limit=1, offset=1)
+        print(f"First page: {first_page}")
+        print(f"Second page: {second_page}")
+        if first_page and second_page and first_page[0]['id'] == second_page[0]['id']:
+            print("Pagination error: pages overlap")
+        
         # Test getting specific neologism
         print("\n6. Testing specific neologism retrieval...")
         get_result = client.get_neologism(neologism_id)
@@ -144,6 +167,7 @@ def test_api():
             )
             print(f"Conflict resolution: {resolve_result}")
     
+    client.close()
     print("\nAPI tests completed!")
 
 